@@ -16,9 +16,12 @@
 
 from __future__ import annotations
 
+import collections
 import errno
+import io
 import pathlib
-import re
+import posixpath
+import sys
 import typing
 
 import ops
@@ -28,9 +31,10 @@ from . import _constants, _errors, _fileinfo
 
 if typing.TYPE_CHECKING:
     import os
-    from typing import Generator, Literal
+    from typing import BinaryIO, Generator, Literal, Sequence
 
-    from typing_extensions import Self, TypeGuard
+    from _typeshed import WriteableBuffer
+    from typing_extensions import Self
 
 
 class RelativePathError(ValueError):
@@ -42,6 +46,67 @@ class RelativePathError(ValueError):
     """
 
 
+_ContainerPathT = typing.TypeVar('_ContainerPathT', bound='ContainerPath')
+
+
+class _ContainerPathParents(typing.Sequence[_ContainerPathT]):
+    """Lazy sequence of a :class:`ContainerPath`'s logical parents, like pathlib's."""
+
+    __slots__ = ('_parents', '_path')
+
+    def __init__(self, path: _ContainerPathT) -> None:
+        self._path = path
+        self._parents = path._path.parents
+
+    def __len__(self) -> int:
+        return len(self._parents)
+
+    @typing.overload
+    def __getitem__(self, index: int) -> _ContainerPathT: ...
+    @typing.overload
+    def __getitem__(self, index: slice) -> tuple[_ContainerPathT, ...]: ...
+    def __getitem__(self, index: int | slice) -> _ContainerPathT | tuple[_ContainerPathT, ...]:
+        if isinstance(index, slice):
+            return tuple(self[i] for i in range(*index.indices(len(self))))
+        if index < 0:  # negative indices are unsupported by pathlib before Python 3.10
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return self._path._with_pure_path(self._parents[index])
+
+    # parents used to be a tuple, so keep comparing and hashing like one
+    def __eq__(self, other: object, /) -> bool:
+        if isinstance(other, _ContainerPathParents):
+            return tuple(self) == tuple(other)  # pyright: ignore[reportUnknownArgumentType]
+        if isinstance(other, tuple):
+            return tuple(self) == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    def __repr__(self) -> str:
+        return f'<{self._path!r}.parents>'
+
+
+class _BufferReader(io.RawIOBase):
+    """Binary file-like object reading from a buffer, so it can be pushed without a full copy."""
+
+    def __init__(self, view: memoryview) -> None:
+        self._view = view
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: WriteableBuffer, /) -> int:
+        with memoryview(buffer) as target_view, target_view.cast('B') as target:
+            with self._view[self._pos : self._pos + len(target)] as chunk:
+                target[: len(chunk)] = chunk
+                self._pos += len(chunk)
+                return len(chunk)
+
+
 class ContainerPath:
     r"""Implementation of :class:`PathProtocol` for Pebble-based workload containers.
 
@@ -71,13 +136,49 @@ class ContainerPath:
         RelativePathError: If instantiated with a relative path.
     """
 
+    __slots__ = (
+        '__weakref__',
+        '_caches_info',
+        '_container',
+        '_container_name',
+        '_hash',
+        '_info_cache',
+        '_path_str',
+        '_pure_path',
+    )
+
+    _can_skip_init: typing.ClassVar[bool] = True
+    """Whether :meth:`_with_pure_path` may bypass :meth:`with_segments` and ``__init__``."""
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        # subclasses customising construction must have every new instance go through it
+        cls._can_skip_init = (
+            cls.with_segments is ContainerPath.with_segments
+            and cls.__init__ is ContainerPath.__init__
+        )
+
     def __init__(self, *parts: str | os.PathLike[str], container: ops.Container) -> None:
         self._container = container
-        self._path = pathlib.PurePosixPath(*parts)
-        if not self._path.is_absolute():
-            raise RelativePathError(
-                f'ContainerPath arguments resolve to relative path: {self._path}'
-            )
+        path = pathlib.PurePosixPath(*parts)
+        if not path.is_absolute():
+            raise RelativePathError(f'ContainerPath arguments resolve to relative path: {path}')
+        # neither the container nor the path can change, so their string forms (and the hash,
+        # on first use) are cached
+        self._path_str = str(path)
+        # interned, so comparing names from different ops.Container objects hits the is check
+        self._container_name = sys.intern(container.name)
+        self._hash: int | None = None
+        self._pure_path: pathlib.PurePosixPath | None = path
+        self._caches_info = False
+        self._info_cache: tuple[pebble.FileInfo | None] | None = None
+
+    @property
+    def _path(self) -> pathlib.PurePosixPath:
+        # paths from Pebble are created from their string alone, and only parsed if needed
+        if self._pure_path is None:
+            self._pure_path = pathlib.PurePosixPath(self._path_str)
+        return self._pure_path
 
     #############################
     # protocol PurePath methods #
@@ -85,12 +186,14 @@ class ContainerPath:
 
     def __hash__(self) -> int:
         """Hash the tuple (container-name, path) for efficiency."""
-        return hash((self._container.name, self._path))
+        if self._hash is None:
+            self._hash = hash((self._container_name, self._path_str))
+        return self._hash
 
     def __repr__(self) -> str:
         """Return a string representation including the class, path string, and container name."""
-        container_repr = f'<ops.Container {self._container.name!r}>'
-        return f"{type(self).__name__}('{self._path}', container={container_repr})"
+        container_repr = f'<ops.Container {self._container_name!r}>'
+        return f"{type(self).__name__}('{self._path_str}', container={container_repr})"
 
     def __str__(self) -> str:
         """Return the string representation of the path in the container.
@@ -98,37 +201,50 @@ class ContainerPath:
         This is equivalent to the string representation of the :class:`pathlib.PurePath` this
         :class:`ContainerPath` was instantiated with.
         """
-        return self._path.__str__()
+        return self._path_str
 
     def as_posix(self) -> str:
         """Return the string representation of the path in the container."""
-        return self._path.__str__()
+        return self._path_str
 
     def __lt__(self, other: Self) -> bool:
-        if not self._can_compare(other):
+        if (
+            not isinstance(other, ContainerPath)  # pyright: ignore[reportUnnecessaryIsInstance]
+            or other._container_name != self._container_name
+        ):
             return NotImplemented
         return self._path < other._path
 
     def __le__(self, other: Self) -> bool:
-        if not self._can_compare(other):
+        if (
+            not isinstance(other, ContainerPath)  # pyright: ignore[reportUnnecessaryIsInstance]
+            or other._container_name != self._container_name
+        ):
             return NotImplemented
         return self._path <= other._path
 
     def __gt__(self, other: Self) -> bool:
-        if not self._can_compare(other):
+        if (
+            not isinstance(other, ContainerPath)  # pyright: ignore[reportUnnecessaryIsInstance]
+            or other._container_name != self._container_name
+        ):
             return NotImplemented
         return self._path > other._path
 
     def __ge__(self, other: Self) -> bool:
-        if not self._can_compare(other):
+        if (
+            not isinstance(other, ContainerPath)  # pyright: ignore[reportUnnecessaryIsInstance]
+            or other._container_name != self._container_name
+        ):
             return NotImplemented
         return self._path >= other._path
 
     def __eq__(self, other: object, /) -> bool:
-        return self._can_compare(other) and self._path == other._path
-
-    def _can_compare(self, other: object) -> TypeGuard[Self]:
-        return isinstance(other, ContainerPath) and other._container.name == self._container.name
+        return (
+            isinstance(other, ContainerPath)
+            and other._path_str == self._path_str
+            and other._container_name == self._container_name
+        )
 
     def __truediv__(self, key: str | os.PathLike[str]) -> Self:
         """Return a new ``ContainerPath`` with the same container and the joined path.
@@ -140,7 +256,7 @@ class ContainerPath:
             paths. You likely wouldn't want to provide an absolute path as the right-hand operand,
             because the absolute path would completely replace the left-hand path.
         """
-        return self.with_segments(self._path, key)
+        return self._with_pure_path(self._path / key)
 
     def is_absolute(self) -> bool:
         """Return whether the path is absolute (has a root), which is always the case.
@@ -171,7 +287,7 @@ class ContainerPath:
             repr(path.with_name('baz.bin'))
             # ContainerPath('/foo/baz.bin', container=<ops.Container 'c'>)"
         """
-        return self.with_segments(self._path.with_name(name))
+        return self._with_pure_path(self._path.with_name(name))
 
     def with_suffix(self, suffix: str) -> Self:
         """Return a new ContainerPath with the same container and the suffix changed.
@@ -185,7 +301,7 @@ class ContainerPath:
             or ends with a ``'.'``, the ``suffix`` argument is appended to its name. Otherwise,
             the last ``'.'`` and any trailing content is replaced with the ``suffix`` argument.
         """
-        return self.with_segments(self._path.with_suffix(suffix))
+        return self._with_pure_path(self._path.with_suffix(suffix))
 
     def joinpath(self, *other: str | os.PathLike[str]) -> Self:
         r"""Return a new ContainerPath with the same container and the new args joined to its path.
@@ -207,17 +323,25 @@ class ContainerPath:
             :class:`ContainerPath` is not :class:`os.PathLike`. A :class:`ContainerPath` instance
             is not a valid value for ``other``, and will result in an error.
         """
-        return self.with_segments(self._path, *other)
+        return self._with_pure_path(self._path.joinpath(*other))
 
     @property
-    def parents(self) -> tuple[Self, ...]:
-        """A sequence of this path's logical parents. Each parent is a :class:`ContainerPath`."""
-        return tuple(self.with_segments(p) for p in self._path.parents)
+    def parents(self) -> Sequence[Self]:
+        """A sequence of this path's logical parents. Each parent is a :class:`ContainerPath`.
+
+        Parents are constructed lazily, when they are accessed.
+
+        .. note::
+            Like :attr:`pathlib.PurePath.parents`, this is a lazy sequence, not a :class:`tuple`.
+            It compares equal to (and hashes like) the tuple of the same parents, but tuple
+            operations such as concatenation with ``+`` require ``tuple(path.parents)``.
+        """
+        return _ContainerPathParents(self)
 
     @property
     def parent(self) -> Self:
         """The logical parent of this path, as a :class:`ContainerPath`."""
-        return self.with_segments(self._path.parent)
+        return self._with_pure_path(self._path.parent)
 
     @property
     def parts(self) -> tuple[str, ...]:
@@ -227,7 +351,7 @@ class ContainerPath:
     @property
     def name(self) -> str:
         """The final path component, or an empty string if this is the root path."""
-        return self._path.name
+        return self._path_str.rpartition('/')[2]
 
     @property
     def suffix(self) -> str:
@@ -278,10 +402,7 @@ class ContainerPath:
             PermissionError: if the Pebble user does not have permissions for the operation.
             PebbleConnectionError: if the remote Pebble client cannot be reached.
         """
-        text = self._pull(text=True)
-        if newline is None:
-            return re.sub(r'\r\n|\r', '\n', text)
-        return text
+        return self._pull(text=True, newline=newline)
 
     def read_bytes(self) -> bytes:
         """Read a remote file as bytes and return the contents.
@@ -298,14 +419,18 @@ class ContainerPath:
         return self._pull(text=False)
 
     @typing.overload
-    def _pull(self, *, text: Literal[True]) -> str: ...
+    def _pull(self, *, text: Literal[True], newline: str | None = None) -> str: ...
     @typing.overload
     def _pull(self, *, text: Literal[False] = False) -> bytes: ...
-    def _pull(self, *, text: bool = False):
-        encoding = 'utf-8' if text else None
+    def _pull(self, *, text: bool = False, newline: str | None = None):
         try:
-            with self._container.pull(self._path, encoding=encoding) as f:
-                return f.read()
+            with self._container.pull(self._path_str, encoding=None) as f:
+                if not text:
+                    return f.read()
+                # decode and translate newlines incrementally as the file is read,
+                # rather than post-processing the full decoded string in a second pass
+                newline = None if newline is None else ''
+                return io.TextIOWrapper(f, encoding='utf-8', newline=newline).read()
         except pebble.PathError as e:
             msg = repr(self)
             _errors.raise_if_matches_file_not_found(e, msg=msg)
@@ -329,12 +454,18 @@ class ContainerPath:
             PermissionError: If the local or remote user does not have appropriate permissions.
             PebbleConnectionError: If the remote container cannot be reached.
         """
-        info = _fileinfo.from_container_path(self)  # FileNotFoundError if path doesn't exist
-        if info.type != pebble.FileType.DIRECTORY:
-            _errors.raise_not_a_directory(repr(self))
-        file_infos = self._container.list_files(self._path)
+        file_infos = _fileinfo.list_from_container_path(self)  # FileNotFoundError if missing
+        if len(file_infos) == 1 and file_infos[0].type is not pebble.FileType.DIRECTORY:
+            # Pebble lists a non-directory as only itself, which we can usually tell apart from
+            # a directory with one child by its path -- otherwise we need to ask Pebble directly
+            (info,) = file_infos
+            if info.path == self._path_str or (
+                info.path != posixpath.join(self._path_str, info.name)
+                and _fileinfo.from_container_path(self).type is not pebble.FileType.DIRECTORY
+            ):
+                _errors.raise_not_a_directory(repr(self))
         for f in file_infos:
-            yield self.with_segments(f.path)
+            yield self._with_listed_info(f)
 
     def glob(self, pattern: str | os.PathLike[str]) -> Generator[Self]:
         r"""Iterate over this directory and yield all paths matching the provided pattern.
@@ -362,37 +493,49 @@ class ContainerPath:
         """
         return self._glob(pattern)
 
-    def _glob(self, pattern: str | os.PathLike[str], skip_is_dir: bool = False) -> Generator[Self]:
+    def _glob(self, pattern: str | os.PathLike[str]) -> Generator[Self]:
         pattern_path = pathlib.PurePosixPath(pattern)
         if pattern_path.is_absolute():
             raise NotImplementedError('Non-relative paths are unsupported.')
         elif pattern_path == pathlib.PurePosixPath('.'):
             raise ValueError(f'Unacceptable pettern: {pattern!r}')
-        *pattern_parents, pattern_itself = pattern_path.parts
-        if '**' in pattern_parents:
-            raise NotImplementedError('Recursive glob is not supported.')
+        segments = pattern_path.parts
         if '**' in str(pattern):
+            if '**' in segments[:-1]:
+                raise NotImplementedError('Recursive glob is not supported.')
             raise ValueError("Invalid pattern: '**' can only be an entire path component")
-        if not skip_is_dir and not self.is_dir():
+        if not self.is_dir():
             yield from ()
             return
-        if not pattern_parents:
-            file_infos = self._container.list_files(self._path, pattern=pattern_itself)
-            for f in file_infos:
-                yield self.with_segments(f.path)
-            return
-        first, *rest = pattern_parents
-        next_pattern = pathlib.PurePosixPath(*rest, pattern_itself)
-        if first == '*':
-            for container_path in self.iterdir():
+        last = len(segments) - 1
+        # breadth-first walk over (directory, index of the segment to match in it)
+        work: collections.deque[tuple[Self, int]] = collections.deque([(self, 0)])
+        while work:
+            path, index = work.popleft()
+            segment = segments[index]
+            if index == last:
+                for f in _fileinfo.list_from_container_path(path, pattern=segment):
+                    yield self._with_listed_info(f)
+                continue
+            if '*' not in segment:
+                # join all consecutive literal segments at once, so only the result needs checking
+                end = index + 1
+                while end < last and '*' not in segments[end]:
+                    end += 1
+                container_path = path.joinpath(*segments[index:end])
                 if container_path.is_dir():
-                    yield from container_path._glob(next_pattern, skip_is_dir=True)
-        elif '*' in first:
-            for container_path in self._glob(first):
-                if container_path.is_dir():
-                    yield from container_path._glob(next_pattern, skip_is_dir=True)
-        else:
-            yield from (self / first)._glob(next_pattern)
+                    work.append((container_path, end))
+                continue
+            # a single listing gives every match along with its type, so only symlinks need
+            # another round trip (to check whether they point to a directory)
+            file_infos = _fileinfo.list_from_container_path(
+                path, pattern=None if segment == '*' else segment
+            )
+            for f in file_infos:
+                if f.type is pebble.FileType.DIRECTORY or f.type is pebble.FileType.SYMLINK:
+                    container_path = path._with_path_str(f.path)
+                    if f.type is pebble.FileType.DIRECTORY or container_path.is_dir():
+                        work.append((container_path, index + 1))
 
     def owner(self) -> str:
         """Return the user name of the file owner.
@@ -401,7 +544,7 @@ class ContainerPath:
             FileNotFoundError: If the path does not exist.
             PebbleConnectionError: If the remote container cannot be reached.
         """
-        info = _fileinfo.from_container_path(self)  # FileNotFoundError if path doesn't exist
+        info = self._get_fileinfo()  # FileNotFoundError if path doesn't exist
         user = info.user
         assert user is not None
         return user
@@ -413,7 +556,7 @@ class ContainerPath:
             FileNotFoundError: If the path does not exist.
             PebbleConnectionError: If the remote container cannot be reached.
         """
-        info = _fileinfo.from_container_path(self)  # FileNotFoundError if path doesn't exist
+        info = self._get_fileinfo()  # FileNotFoundError if path doesn't exist
         group = info.group
         assert group is not None
         return group
@@ -427,7 +570,7 @@ class ContainerPath:
         Raises:
             PebbleConnectionError: If the remote container cannot be reached.
         """
-        return self._exists_and_matches(filetype=None)
+        return self._try_get_fileinfo() is not None
 
     def is_dir(self) -> bool:
         """Whether this path exists and is a directory.
@@ -437,7 +580,8 @@ class ContainerPath:
         Raises:
             PebbleConnectionError: If the remote container cannot be reached.
         """
-        return self._exists_and_matches(pebble.FileType.DIRECTORY)
+        info = self._try_get_fileinfo()
+        return info is not None and info.type is pebble.FileType.DIRECTORY
 
     def is_file(self) -> bool:
         """Whether this path exists and is a regular file.
@@ -447,7 +591,8 @@ class ContainerPath:
         Raises:
             PebbleConnectionError: If the remote container cannot be reached.
         """
-        return self._exists_and_matches(pebble.FileType.FILE)
+        info = self._try_get_fileinfo()
+        return info is not None and info.type is pebble.FileType.FILE
 
     def is_fifo(self) -> bool:
         """Whether this path exists and is a named pipe (also called a FIFO).
@@ -457,7 +602,8 @@ class ContainerPath:
         Raises:
             PebbleConnectionError: If the remote container cannot be reached.
         """
-        return self._exists_and_matches(pebble.FileType.NAMED_PIPE)
+        info = self._try_get_fileinfo()
+        return info is not None and info.type is pebble.FileType.NAMED_PIPE
 
     def is_socket(self) -> bool:
         """Whether this path exists and is a socket.
@@ -467,7 +613,8 @@ class ContainerPath:
         Raises:
             PebbleConnectionError: If the remote container cannot be reached.
         """
-        return self._exists_and_matches(pebble.FileType.SOCKET)
+        info = self._try_get_fileinfo()
+        return info is not None and info.type is pebble.FileType.SOCKET
 
     def is_symlink(self) -> bool:
         """Whether this path is a symbolic link.
@@ -481,17 +628,9 @@ class ContainerPath:
             return False
         return info.type == pebble.FileType.SYMLINK
 
-    def _exists_and_matches(self, filetype: pebble.FileType | None) -> bool:
-        info = self._try_get_fileinfo()
-        if info is None:
-            return False
-        if filetype is None:  # we only care if the file exists
-            return True
-        return info.type is filetype
-
     def _try_get_fileinfo(self) -> pebble.FileInfo | None:
         try:
-            return _fileinfo.from_container_path(self)
+            return self._get_fileinfo()
         except FileNotFoundError:
             pass
         except OSError as e:
@@ -500,6 +639,21 @@ class ContainerPath:
             # else: too many levels of symbolic links
         return None
 
+    def _get_fileinfo(self) -> pebble.FileInfo:
+        if not self._caches_info:
+            return _fileinfo.from_container_path(self)
+        if self._info_cache is None:
+            try:
+                info = _fileinfo.from_container_path(self)
+            except FileNotFoundError:
+                self._info_cache = (None,)  # remember that the path doesn't exist too
+                raise
+            self._info_cache = (info,)
+        (info,) = self._info_cache
+        if info is None:
+            _errors.raise_file_not_found(repr(self))
+        return info
+
     def rmdir(self) -> None:
         """Remove this path if it is an empty directory.
 
@@ -530,13 +684,15 @@ class ContainerPath:
 
     def _remove_path(self) -> None:
         try:
-            self._container.remove_path(self._path)
+            self._container.remove_path(self._path_str)
         except pebble.PathError as e:
             msg = repr(self)
             _errors.raise_if_matches_directory_not_empty(e, msg=msg)
             _errors.raise_if_matches_file_not_found(e, msg=msg)
             _errors.raise_if_matches_permission(e, msg=msg)
             raise
+        finally:
+            self._info_cache = None
 
     ##################################################
     # protocol Path methods with extended signatures #
@@ -556,8 +712,10 @@ class ContainerPath:
         and ``group`` args. These are forwarded to Pebble, which sets these on file creation.
 
         Args:
-            data: The bytes to write. If data is a :class:`bytearray` or :class:`memoryview`, it
-                will be converted to :class:`bytes` in memory first.
+            data: The bytes to write. If data is a contiguous :class:`bytearray` or
+                :class:`memoryview`, it will be streamed to Pebble from the original buffer,
+                without copying it first. A non-contiguous :class:`memoryview` will be converted
+                to :class:`bytes` in memory first.
             mode: The permissions to set on the file. Defaults to 0o644 (-rw-r--r--) for new files.
                 If the file already exists, its permissions will be changed,
                 unless ``mode`` is ``None`` (default).
@@ -579,9 +737,28 @@ class ContainerPath:
             PermissionError: if the Pebble user does not have permissions for the operation.
             PebbleConnectionError: if the remote Pebble client cannot be reached.
         """
-        if isinstance(data, (bytearray, memoryview)):
-            # TODO: update ops to correctly test for bytearray and memoryview in push
-            data = bytes(data)
+        if isinstance(data, bytes):
+            self._push(data, mode=mode, user=user, group=group)
+            return len(data)
+        # ops.Container.push only accepts str, bytes, or a file-like object as its source
+        # the views are released on return, so the caller's buffer isn't locked (e.g. against
+        # resizing a bytearray) even while a traceback from a failed push is still alive
+        with memoryview(data) as view:
+            if not view.c_contiguous:
+                self._push(view.tobytes(), mode=mode, user=user, group=group)
+                return view.nbytes
+            with view.cast('B') as flat:
+                source = typing.cast('BinaryIO', _BufferReader(flat))
+                self._push(source, mode=mode, user=user, group=group)
+            return view.nbytes
+
+    def _push(
+        self,
+        source: bytes | BinaryIO,
+        mode: int | None,
+        user: str | None,
+        group: str | None,
+    ) -> None:
         if mode is None or user is None:
             # if the file already exists, don't change owner or mode unless explicitly requested
             try:
@@ -595,8 +772,8 @@ class ContainerPath:
                     user = info.user
         try:
             self._container.push(
-                path=self._path,
-                source=data,
+                path=self._path_str,
+                source=source,
                 make_dirs=False,
                 permissions=mode,
                 user=user,
@@ -609,7 +786,8 @@ class ContainerPath:
             _errors.raise_if_matches_not_a_directory(e, msg=msg)
             _errors.raise_if_matches_permission(e, msg=msg)
             raise
-        return len(data)
+        finally:
+            self._info_cache = None
 
     def write_text(
         self,
@@ -649,8 +827,10 @@ class ContainerPath:
             PermissionError: if the Pebble user does not have permissions for the operation.
             PebbleConnectionError: if the remote Pebble client cannot be reached.
         """
+        # encode before any request, so invalid data can't leave the file partially written
         encoded_data = data.encode()
-        return self.write_bytes(encoded_data, mode=mode, user=user, group=group)
+        self._push(encoded_data, mode=mode, user=user, group=group)
+        return len(encoded_data)
 
     def mkdir(
         self,
@@ -692,23 +872,35 @@ class ContainerPath:
             PermissionError: if the remote user does not have permissions for the operation.
             PebbleConnectionError: if the remote Pebble client cannot be reached.
         """
-        if parents and not exist_ok and self.exists():
-            _errors.raise_file_exists(repr(self))
-        if exist_ok and not parents and not self.parent.exists():
-            _errors.raise_file_not_found(repr(self.parent))
-        if parents and mode != _constants.DEFAULT_MKDIR_MODE:
-            # create parents with default permissions, following pathlib
+        if parents and exist_ok:  # Pebble's make_parents has the same semantics
+            if mode != _constants.DEFAULT_MKDIR_MODE:
+                # create parents with default permissions, following pathlib
+                self._mkdir_parents()
+            self._mkdir(
+                path=self._path_str, make_parents=True, permissions=mode, user=user, group=group
+            )
+            return
+        # otherwise follow pathlib: try to make the directory, and only check on failure
+        try:
+            self._mkdir(
+                path=self._path_str, make_parents=False, permissions=mode, user=user, group=group
+            )
+        except FileNotFoundError:
+            if not parents:
+                raise
+            self._mkdir_parents()
             self._mkdir(
-                path=self._path.parent,
-                make_parents=True,
-                permissions=_constants.DEFAULT_MKDIR_MODE,
+                path=self._path_str, make_parents=False, permissions=mode, user=user, group=group
             )
+        except FileExistsError:
+            if not exist_ok or not self.is_dir():
+                raise
+
+    def _mkdir_parents(self) -> None:
         self._mkdir(
-            path=self._path,
-            make_parents=exist_ok or parents,
-            permissions=mode,
-            user=user,
-            group=group,
+            path=self._path.parent,
+            make_parents=True,
+            permissions=_constants.DEFAULT_MKDIR_MODE,
         )
 
     def _mkdir(
@@ -731,19 +923,52 @@ class ContainerPath:
             _errors.raise_if_matches_lookup(e, msg=e.message)
             msg = repr(self)
             if _errors.matches_not_a_directory(e):
-                # target exists and isn't a directory, or parent isn't a directory
-                if not self.parent.is_dir():
+                # an ancestor isn't a directory, or (with make_parents) the target isn't either
+                if not make_parents or not self.parent.is_dir():
                     _errors.raise_not_a_directory(msg=msg, from_=e)
                 _errors.raise_file_exists(repr(self), from_=e)
             _errors.raise_if_matches_file_exists(e, msg=msg)
             _errors.raise_if_matches_file_not_found(e, msg=msg)
             _errors.raise_if_matches_permission(e, msg=msg)
             raise
+        finally:
+            self._info_cache = None
 
     #############################
     # non-protocol Path methods #
     #############################
 
+    def cache_info(self) -> Self:
+        """Return a new ``ContainerPath`` for the same path, which caches its file information.
+
+        By default, every call to :meth:`exists`, :meth:`is_dir`, :meth:`is_file`,
+        :meth:`is_fifo`, :meth:`is_socket`, :meth:`owner` and :meth:`group` makes a request
+        to Pebble, just as the equivalent :class:`pathlib.Path` methods make a system call.
+        On the returned path, these methods share a single request, whose result is reused
+        until :meth:`refresh` is called, or the path is modified using its own
+        :meth:`write_bytes`, :meth:`write_text`, :meth:`mkdir`, :meth:`rmdir` or :meth:`unlink`.
+        Changes made by any other means, including through other :class:`ContainerPath` objects,
+        will not be seen until then.
+
+        Paths derived from the returned path, such as its :meth:`parent`, do not cache, except
+        for those yielded by its :meth:`iterdir` and :meth:`glob`. These cache the information
+        that Pebble already returned when listing their directory, so checking the type of each
+        one needs no further requests, unless it is a symlink.
+
+        ::
+
+            path = ContainerPath('/foo', container=container).cache_info()
+            if path.exists() and path.is_dir():  # a single Pebble request
+                ...
+        """
+        new = self._with_pure_path(self._path)
+        new._caches_info = True
+        return new
+
+    def refresh(self) -> None:
+        """Discard any file information cached by a path returned from :meth:`cache_info`."""
+        self._info_cache = None
+
     def with_segments(self, *pathsegments: str | os.PathLike[str]) -> Self:
         """Construct a new ``ContainerPath`` (with the same container) from path-like objects.
 
@@ -756,3 +981,41 @@ class ContainerPath:
         The same is true of :class:`pathlib.Path` in Python 3.12+.
         """
         return type(self)(*pathsegments, container=self._container)
+
+    def _with_pure_path(self, path: pathlib.PurePosixPath) -> Self:
+        """Like :meth:`with_segments`, for a path already known to be absolute.
+
+        For all the paths passed here (joins onto, and parents of, this path), parsing the path
+        again and checking that it is absolute is dead work, so this skips ``__init__`` unless a
+        subclass customises construction.
+        """
+        if not self._can_skip_init:
+            return self.with_segments(path)
+        return self._new(path, str(path))
+
+    def _with_path_str(self, path_str: str) -> Self:
+        """Like :meth:`_with_pure_path`, for an absolute and normalised path string from Pebble."""
+        if not self._can_skip_init:
+            return self.with_segments(path_str)
+        return self._new(None, path_str)
+
+    def _with_listed_info(self, info: pebble.FileInfo) -> Self:
+        """Like :meth:`_with_path_str`, also caching the listed info if this path caches."""
+        new = self._with_path_str(info.path)
+        if self._caches_info:
+            new._caches_info = True
+            # listings describe symlinks themselves, rather than following them
+            if info.type is not pebble.FileType.SYMLINK:
+                new._info_cache = (info,)
+        return new
+
+    def _new(self, path: pathlib.PurePosixPath | None, path_str: str) -> Self:
+        new = object.__new__(type(self))
+        new._container = self._container
+        new._container_name = self._container_name
+        new._hash = None
+        new._pure_path = path
+        new._path_str = path_str
+        new._caches_info = False
+        new._info_cache = None
+        return new
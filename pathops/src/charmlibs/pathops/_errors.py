@@ -22,6 +22,15 @@ from typing import NoReturn
 
 from ops import pebble
 
+# the messages never change, so look them up once rather than on every error
+_EEXIST_MSG = os.strerror(errno.EEXIST)
+_EISDIR_MSG = os.strerror(errno.EISDIR)
+_ELOOP_MSG = os.strerror(errno.ELOOP)
+_ENOENT_MSG = os.strerror(errno.ENOENT)
+_ENOTDIR_MSG = os.strerror(errno.ENOTDIR)
+_ENOTEMPTY_MSG = os.strerror(errno.ENOTEMPTY)
+_EPERM_MSG = os.strerror(errno.EPERM)
+
 
 def raise_if_matches_directory_not_empty(error: pebble.Error, msg: str) -> None:
     if (
@@ -29,11 +38,11 @@ def raise_if_matches_directory_not_empty(error: pebble.Error, msg: str) -> None:
         and error.kind == 'generic-file-error'
         and 'directory not empty' in error.message
     ):
-        raise OSError(errno.ENOTEMPTY, os.strerror(errno.ENOTEMPTY), msg) from error
+        raise OSError(errno.ENOTEMPTY, _ENOTEMPTY_MSG, msg) from error
 
 
 def raise_file_exists(msg: str, from_: BaseException | None = None) -> NoReturn:
-    e = FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), msg)
+    e = FileExistsError(errno.EEXIST, _EEXIST_MSG, msg)
     raise e from from_
 
 
@@ -53,7 +62,7 @@ def raise_file_not_found(msg: str, from_: BaseException | None = None) -> NoRetu
     # since FileNotFoundError is a subtype of OSError, and this case should be rare
     # it seems sensible to just raise FileNotFoundError here, without checking
     # if the file in question is a socket
-    raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), msg) from from_
+    raise FileNotFoundError(errno.ENOENT, _ENOENT_MSG, msg) from from_
 
 
 def raise_if_matches_file_not_found(error: pebble.Error, msg: str) -> None:
@@ -64,7 +73,7 @@ def raise_if_matches_file_not_found(error: pebble.Error, msg: str) -> None:
 
 
 def raise_is_a_directory(msg: str, from_: BaseException | None = None) -> None:
-    raise IsADirectoryError(errno.EISDIR, os.strerror(errno.EISDIR), msg) from from_
+    raise IsADirectoryError(errno.EISDIR, _EISDIR_MSG, msg) from from_
 
 
 def raise_if_matches_is_a_directory(error: pebble.Error, msg: str) -> None:
@@ -98,7 +107,7 @@ def matches_not_a_directory(error: pebble.Error) -> bool:
 
 
 def raise_not_a_directory(msg: str, from_: BaseException | None = None) -> NoReturn:
-    raise NotADirectoryError(errno.ENOTDIR, os.strerror(errno.ENOTDIR), msg) from from_
+    raise NotADirectoryError(errno.ENOTDIR, _ENOTDIR_MSG, msg) from from_
 
 
 def raise_if_matches_not_a_directory(error: pebble.Error, msg: str) -> None:
@@ -108,7 +117,7 @@ def raise_if_matches_not_a_directory(error: pebble.Error, msg: str) -> None:
 
 def raise_if_matches_permission(error: pebble.Error, msg: str) -> None:
     if isinstance(error, pebble.PathError) and error.kind == 'permission-denied':
-        raise PermissionError(errno.EPERM, os.strerror(errno.EPERM), msg) from error
+        raise PermissionError(errno.EPERM, _EPERM_MSG, msg) from error
 
 
 def raise_if_matches_too_many_levels_of_symlinks(error: pebble.Error, msg: str) -> None:
@@ -117,4 +126,4 @@ def raise_if_matches_too_many_levels_of_symlinks(error: pebble.Error, msg: str)
         and error.code == 400
         and 'too many levels of symbolic links' in error.message
     ):
-        raise OSError(errno.ELOOP, os.strerror(errno.ELOOP), msg) from error
+        raise OSError(errno.ELOOP, _ELOOP_MSG, msg) from error
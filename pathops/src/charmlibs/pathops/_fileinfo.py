@@ -49,9 +49,15 @@ def from_container_path(path: ContainerPath, follow_symlinks: bool = True) -> pe
     return _get_fileinfo_from_parent(path)
 
 
-def _get_fileinfo_directly(path: ContainerPath) -> pebble.FileInfo:
+def list_from_container_path(
+    path: ContainerPath, pattern: str | None = None, itself: bool = False
+) -> list[pebble.FileInfo]:
+    """List a directory's contents, following symlinks.
+
+    If ``path`` isn't a directory (or ``itself`` is ``True``), Pebble lists only ``path`` itself.
+    """
     try:
-        info_list = path._container.list_files(path._path, itself=True)
+        return path._container.list_files(path._path_str, pattern=pattern, itself=itself)
     except (pebble.APIError, pebble.PathError) as e:
         msg = repr(path)
         _errors.raise_if_matches_file_not_found(e, msg=msg)
@@ -59,6 +65,10 @@ def _get_fileinfo_directly(path: ContainerPath) -> pebble.FileInfo:
         _errors.raise_if_matches_permission(e, msg=msg)
         _errors.raise_if_matches_too_many_levels_of_symlinks(e, msg=msg)
         raise
+
+
+def _get_fileinfo_directly(path: ContainerPath) -> pebble.FileInfo:
+    info_list = list_from_container_path(path, itself=True)
     assert len(info_list) == 1, 'ops.Container.list_files with itself=True returns 1 item'
     return info_list[0]
 
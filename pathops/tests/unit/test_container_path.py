@@ -16,9 +16,13 @@
 
 from __future__ import annotations
 
+import array
+import datetime
+import io
 import operator
 import pathlib
 import typing
+import weakref
 
 import ops
 import pytest
@@ -28,8 +32,11 @@ import utils
 from charmlibs.pathops import ContainerPath, LocalPath, RelativePathError, _constants, _fileinfo
 
 if typing.TYPE_CHECKING:
+    import os
     from typing import Any, Callable
 
+    from typing_extensions import Self
+
 
 class TestInit:
     def test_ok(self, container: ops.Container):
@@ -57,6 +64,15 @@ class TestInit:
 #####################
 
 
+def test_no_instance_dict(container: ops.Container):
+    assert not hasattr(ContainerPath('/', container=container), '__dict__')
+
+
+def test_weakref(container: ops.Container):
+    path = ContainerPath('/', container=container)
+    assert weakref.ref(path)() is path
+
+
 def test_hash(container: ops.Container):
     paths = ('/foo', '/foo/bar', '/foo/bar/byte')
     di = {ContainerPath(path, container=container): path for path in paths}
@@ -89,6 +105,7 @@ class TestComparison:
             ('/foo', '/foo/bar'),
             ('/foo/bar', '/foo/bartholemew'),
             ('/foo/bar', '/foob/ar'),
+            ('/foo/bar', '/foo-bar'),  # ordered by parts, unlike the path strings
         ),
     )
     @pytest.mark.parametrize(
@@ -260,6 +277,17 @@ def test_parents(container: ops.Container):
     container_path = ContainerPath(path, container=container)
     container_result = tuple(str(p) for p in container_path.parents)
     assert container_result == pathlib_result
+    assert len(container_path.parents) == len(pathlib_result)
+    assert str(container_path.parents[0]) == pathlib_result[0]
+    assert str(container_path.parents[-1]) == pathlib_result[-1]
+    assert tuple(str(p) for p in container_path.parents[1:]) == pathlib_result[1:]
+    with pytest.raises(IndexError):
+        container_path.parents[len(pathlib_result)]
+    parents = tuple(container_path.parents)
+    assert container_path.parents == container_path.parents
+    assert container_path.parents == parents
+    assert hash(container_path.parents) == hash(parents)
+    assert container_path.parents != container_path.parent.parents
 
 
 def test_parent(container: ops.Container):
@@ -310,11 +338,299 @@ def test_stem(container: ops.Container):
     assert container_result == pathlib_result
 
 
+def test_subclass_with_segments_is_used(container: ops.Container):
+    class MyPath(ContainerPath):
+        depth = 0
+
+        def with_segments(self, *pathsegments: str | os.PathLike[str]) -> Self:
+            new = super().with_segments(*pathsegments)
+            new.depth = self.depth + 1
+            return new
+
+    path = MyPath('/foo/bar.txt', container=container)
+    derived = (
+        path / 'baz',
+        path.joinpath('baz'),
+        path.with_name('baz'),
+        path.with_suffix('.bin'),
+        path.parent,
+        path.parents[0],
+    )
+    for p in derived:
+        assert type(p) is MyPath
+        assert p.depth == 1
+
+
 #########################
 # concrete path methods #
 #########################
 
 
+@pytest.mark.parametrize(
+    ('newline', 'expected'),
+    ((None, 'a\nb\nc\nd\n'), ('', 'a\r\nb\rc\nd\r\n')),
+)
+def test_read_text_newlines(
+    monkeypatch: pytest.MonkeyPatch,
+    container: ops.Container,
+    newline: str | None,
+    expected: str,
+):
+    def mock_pull(*args: object, **kwargs: object) -> io.BytesIO:
+        return io.BytesIO(b'a\r\nb\rc\nd\r\n')
+
+    monkeypatch.setattr(container, 'pull', mock_pull)
+    assert ContainerPath('/', container=container).read_text(newline=newline) == expected
+
+
+def _make_fileinfo(path: str, filetype: pebble.FileType) -> pebble.FileInfo:
+    return pebble.FileInfo(
+        path=path,
+        name=pathlib.PurePosixPath(path).name,
+        type=filetype,
+        size=None,
+        permissions=_constants.DEFAULT_WRITE_MODE,
+        last_modified=datetime.datetime.now(),
+        user_id=None,
+        user=None,
+        group_id=None,
+        group=None,
+    )
+
+
+def _mock_list_files(infos: list[pebble.FileInfo]) -> Callable[..., list[pebble.FileInfo]]:
+    def list_files(*args: object, **kwargs: object) -> list[pebble.FileInfo]:
+        return infos
+
+    return list_files
+
+
+class TestIterDir:
+    def test_single_child_is_listed(
+        self, monkeypatch: pytest.MonkeyPatch, container: ops.Container
+    ):
+        infos = [_make_fileinfo('/foo/foo', pebble.FileType.FILE)]
+        monkeypatch.setattr(container, 'list_files', _mock_list_files(infos))
+        container_path = ContainerPath('/foo', container=container)
+        assert list(container_path.iterdir()) == [container_path / 'foo']
+
+    def test_children_behave_like_joined_paths(
+        self, monkeypatch: pytest.MonkeyPatch, container: ops.Container
+    ):
+        infos = [
+            _make_fileinfo('/foo/bar.tar.gz', pebble.FileType.FILE),
+            _make_fileinfo('/foo/baz', pebble.FileType.DIRECTORY),
+        ]
+        monkeypatch.setattr(container, 'list_files', _mock_list_files(infos))
+        container_path = ContainerPath('/foo', container=container)
+        for child, name in zip(container_path.iterdir(), ('bar.tar.gz', 'baz')):
+            expected = container_path / name
+            assert child == expected
+            assert hash(child) == hash(expected)
+            assert str(child) == str(expected)
+            assert child.name == expected.name
+            assert child.parts == expected.parts
+            assert child.suffixes == expected.suffixes
+            assert child.parent == container_path
+            assert not child < expected
+
+    def test_file_lists_itself(self, monkeypatch: pytest.MonkeyPatch, container: ops.Container):
+        infos = [_make_fileinfo('/foo', pebble.FileType.FILE)]
+        monkeypatch.setattr(container, 'list_files', _mock_list_files(infos))
+        with pytest.raises(NotADirectoryError):
+            next(ContainerPath('/foo', container=container).iterdir())
+
+
+class TestCacheInfo:
+    def test_exists_style_methods_share_one_request(
+        self, monkeypatch: pytest.MonkeyPatch, container: ops.Container
+    ):
+        calls: list[object] = []
+        info = _make_fileinfo('/foo', pebble.FileType.DIRECTORY)
+
+        def list_files(*args: object, **kwargs: object) -> list[pebble.FileInfo]:
+            calls.append(args)
+            return [info]
+
+        monkeypatch.setattr(container, 'list_files', list_files)
+        uncached = ContainerPath('/foo', container=container)
+        assert uncached.exists() and uncached.is_dir()
+        assert len(calls) == 2
+        calls.clear()
+        cached = uncached.cache_info()
+        assert cached == uncached
+        assert cached.exists() and cached.is_dir() and not cached.is_file()
+        assert len(calls) == 1
+        cached.refresh()
+        assert cached.exists()
+        assert len(calls) == 2
+        assert cached.parent.exists() and cached.parent.exists()
+        assert len(calls) == 4
+
+    def test_missing_path_is_cached(
+        self, monkeypatch: pytest.MonkeyPatch, container: ops.Container
+    ):
+        calls: list[object] = []
+
+        def list_files(*args: object, **kwargs: object) -> list[pebble.FileInfo]:
+            calls.append(args)
+            raise pebble.PathError(kind='not-found', message='')
+
+        monkeypatch.setattr(container, 'list_files', list_files)
+        cached = ContainerPath('/foo', container=container).cache_info()
+        assert not cached.exists()
+        assert not cached.is_dir()
+        with pytest.raises(FileNotFoundError):
+            cached.owner()
+        assert len(calls) == 1
+
+    def test_iterdir_children_cache_listed_info(
+        self, monkeypatch: pytest.MonkeyPatch, container: ops.Container
+    ):
+        calls: list[object] = []
+        children = [
+            _make_fileinfo('/foo/dir', pebble.FileType.DIRECTORY),
+            _make_fileinfo('/foo/file', pebble.FileType.FILE),
+            _make_fileinfo('/foo/link', pebble.FileType.SYMLINK),
+        ]
+
+        followed = {info.path: info for info in children}
+        followed['/foo/link'] = _make_fileinfo('/foo/link', pebble.FileType.DIRECTORY)
+
+        def list_files(path: str, **kwargs: object) -> list[pebble.FileInfo]:
+            calls.append(path)
+            return [followed[path]] if kwargs.get('itself') else children
+
+        monkeypatch.setattr(container, 'list_files', list_files)
+        directory, file, link = ContainerPath('/foo', container=container).cache_info().iterdir()
+        assert directory.is_dir() and not directory.is_file()
+        assert file.is_file() and not file.is_dir()
+        assert len(calls) == 1
+        assert link.is_dir() and link.exists()
+        assert len(calls) == 2
+        _, uncached, _ = ContainerPath('/foo', container=container).iterdir()
+        assert uncached.is_file()
+        assert len(calls) == 4
+
+    @pytest.mark.parametrize(
+        ('method', 'args'), (('mkdir', ()), ('write_bytes', (b'data',)), ('unlink', ()))
+    )
+    def test_modifying_the_path_discards_the_cache(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        container: ops.Container,
+        method: str,
+        args: tuple[object, ...],
+    ):
+        calls: list[object] = []
+        exists = [method == 'unlink']
+
+        def list_files(*args: object, **kwargs: object) -> list[pebble.FileInfo]:
+            calls.append(args)
+            if not exists[0]:
+                raise pebble.PathError(kind='not-found', message='')
+            return [_make_fileinfo('/foo', pebble.FileType.FILE)]
+
+        def create_or_remove(*args: object, **kwargs: object) -> None:
+            exists[0] = not exists[0]
+
+        monkeypatch.setattr(container, 'list_files', list_files)
+        for container_method in ('make_dir', 'push', 'remove_path'):
+            monkeypatch.setattr(container, container_method, create_or_remove)
+        cached = ContainerPath('/foo', container=container).cache_info()
+        existed = cached.exists()
+        assert cached.exists() is existed
+        assert len(calls) == 1
+        getattr(cached, method)(*args)
+        calls.clear()
+        assert cached.exists() is not existed
+        assert len(calls) == 1
+
+
+@pytest.mark.parametrize(
+    'data',
+    (
+        b'abcd',
+        bytearray(b'abcd'),
+        memoryview(b'abcd'),
+        memoryview(b'abcdefgh')[::2],  # non-contiguous
+        memoryview(array.array('i', range(4))),  # multi-byte items
+    ),
+)
+def test_write_bytes_buffer_types(
+    monkeypatch: pytest.MonkeyPatch, container: ops.Container, data: bytes | bytearray | memoryview
+):
+    pushed: list[bytes] = []
+
+    def push(*args: object, source: bytes | typing.BinaryIO, **kwargs: object) -> None:
+        pushed.append(source if isinstance(source, bytes) else source.read())
+
+    monkeypatch.setattr(container, 'push', push)
+    container_path = ContainerPath('/foo', container=container)
+    result = container_path.write_bytes(data, mode=_constants.DEFAULT_WRITE_MODE, user='')
+    assert pushed == [bytes(data)]
+    assert result == len(bytes(data))
+
+
+def test_write_bytes_releases_buffer(monkeypatch: pytest.MonkeyPatch, container: ops.Container):
+    def push(*args: object, source: typing.BinaryIO, **kwargs: object) -> None:
+        source.read(2)
+        raise pebble.PathError(kind='not-found', message='')
+
+    monkeypatch.setattr(container, 'push', push)
+    data = bytearray(b'abcd')
+    try:
+        ContainerPath('/foo', container=container).write_bytes(data, mode=0o644, user='')
+    except FileNotFoundError:
+        data.extend(b'efgh')  # BufferError if the buffer is still exported
+    else:
+        pytest.fail('FileNotFoundError not raised')
+    assert data == b'abcdefgh'
+
+
+class TestWriteText:
+    @pytest.fixture
+    def files(self, monkeypatch: pytest.MonkeyPatch, container: ops.Container) -> dict[str, bytes]:
+        """Push to and list files in a dict, writing in chunks like a real push."""
+        files = {'/foo': b'original'}
+
+        def list_files(path: str, **kwargs: object) -> list[pebble.FileInfo]:
+            if path not in files:
+                raise pebble.PathError(kind='not-found', message='')
+            return [_make_fileinfo(path, pebble.FileType.FILE)]
+
+        def push(path: str, source: bytes | typing.BinaryIO, **kwargs: object) -> None:
+            files[path] = b''
+            source = io.BytesIO(source) if isinstance(source, bytes) else source
+            for chunk in iter(lambda: source.read(3), b''):
+                files[path] += chunk
+
+        monkeypatch.setattr(container, 'list_files', list_files)
+        monkeypatch.setattr(container, 'push', push)
+        return files
+
+    def test_encodes_utf8(self, container: ops.Container, files: dict[str, bytes]):
+        data = 'a\N{EURO SIGN}b\N{MUSICAL SYMBOL G CLEF}' * 3
+        result = ContainerPath('/foo', container=container).write_text(data)
+        assert files['/foo'] == data.encode()
+        assert result == len(data.encode())
+
+    @pytest.mark.parametrize(
+        ('data', 'error'),
+        (('x' * 10 + '\udc80', UnicodeEncodeError), (b'bytes', AttributeError)),
+    )
+    def test_invalid_data_leaves_file_unchanged(
+        self,
+        container: ops.Container,
+        files: dict[str, bytes],
+        data: Any,
+        error: type[Exception],
+    ):
+        with pytest.raises(error):
+            ContainerPath('/foo', container=container).write_text(data)
+        assert files == {'/foo': b'original'}
+
+
 def test_exists_reraises_unhandled_os_error(
     monkeypatch: pytest.MonkeyPatch, container: ops.Container
 ):